@@ -10,7 +10,8 @@ import asyncio
 import logging
 import os
 import re
-from collections import defaultdict
+from collections import Counter
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -37,10 +38,45 @@ from textual.widgets import (
     Tree,
 )
 
-from rocototop.parser import CycleStatus, RocotoParser, TaskStatus
+from rocototop.parser import DEPENDENCY_OPERATORS, CycleStatus, RocotoParser, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Icon and color for each task state; unknown states fall back to the defaults.
+STATE_ICONS = {
+    "SUCCEEDED": "✅",
+    "RUNNING": "🏃",
+    "FAILED": "❌",
+    "DEAD": "💀",
+    "QUEUED": "🕒",
+    "WAITING": "⌛",
+    "PENDING": "⌛",
+}
+STATE_COLORS = {
+    "SUCCEEDED": "green",
+    "RUNNING": "yellow",
+    "FAILED": "red",
+    "DEAD": "red",
+    "QUEUED": "blue",
+    "WAITING": "white",
+    "PENDING": "white",
+}
+DEFAULT_STATE_ICON = "❓"
+DEFAULT_STATE_COLOR = "white"
+
+# Common states in summary order, with the short label and color used by the
+# global summary and the status bar. Cycle summaries list any other states
+# after these, in the order they were first seen.
+SUMMARY_STATE_LABELS = (
+    ("SUCCEEDED", "S", "green"),
+    ("RUNNING", "R", "yellow"),
+    ("FAILED", "F", "red"),
+    ("DEAD", "D", "red"),
+    ("QUEUED", "Q", "blue"),
+    ("WAITING", "W", "white"),
+)
+SUMMARY_STATES = tuple(state for state, _, _ in SUMMARY_STATE_LABELS)
+
 
 class ConfirmScreen(ModalScreen[bool]):
     """A modal screen for confirmation."""
@@ -80,19 +116,10 @@ class GlobalSummary(Static):
     def update_summary(self, summary: dict[str, int]) -> None:
         """Update the summary display."""
         parts = []
-        states = [
-            ("SUCCEEDED", "S", "green"),
-            ("RUNNING", "R", "yellow"),
-            ("FAILED", "F", "red"),
-            ("DEAD", "D", "red"),
-            ("QUEUED", "Q", "blue"),
-            ("WAITING", "W", "white"),
-        ]
-
         total_tasks = sum(summary.values())
         succeeded_tasks = summary.get("SUCCEEDED", 0)
 
-        for state, short, color in states:
+        for state, short, color in SUMMARY_STATE_LABELS:
             count = summary.get(state, 0)
             if count > 0:
                 parts.append(f"[{color}]{short}:{count}[/{color}]")
@@ -495,7 +522,7 @@ class RocotoApp(App[None]):
         self.log_follow: bool = True
         self.current_log_file: str | None = None
         self._log_lines: list[str] = []
-        self._search_query: str = ""
+        self._search_pattern: re.Pattern[str] | None = None
         self._search_matches: list[int] = []
         self._search_index: int = -1
         self._expanded_cycles: set[str] = set()
@@ -749,24 +776,22 @@ class RocotoApp(App[None]):
             panel.update(f"No tasks found for cycle {cycle}")
             return
 
-        counts = defaultdict(int)
-        for t in tasks:
-            counts[t["state"]] += 1
+        counts = Counter(t["state"] for t in tasks)
 
         table = Table(title=f"Cycle Summary: {cycle}", show_header=True, header_style="bold cyan")
         table.add_column("State")
         table.add_column("Count", justify="right")
 
-        states = ["SUCCEEDED", "RUNNING", "FAILED", "DEAD", "QUEUED", "WAITING"]
-        for s in states:
-            if counts[s] > 0:
-                color = self._get_state_color(s)
-                table.add_row(f"[{color}]{s}[/]", str(counts[s]))
+        for s in SUMMARY_STATES:
+            # Popping leaves only the uncommon states in counts afterwards.
+            c = counts.pop(s, 0)
+            if c > 0:
+                color = STATE_COLORS.get(s, DEFAULT_STATE_COLOR)
+                table.add_row(f"[{color}]{s}[/]", str(c))
 
         # Add any others
         for s, c in counts.items():
-            if s not in states:
-                table.add_row(s, str(c))
+            table.add_row(s, str(c))
 
         panel.update(table)
 
@@ -796,17 +821,7 @@ class RocotoApp(App[None]):
         summary = self.workflow_summary
         parts = []
 
-        # Define priority states and their short names/colors
-        states = [
-            ("SUCCEEDED", "S", "green"),
-            ("RUNNING", "R", "yellow"),
-            ("FAILED", "F", "red"),
-            ("DEAD", "D", "red"),
-            ("QUEUED", "Q", "blue"),
-            ("WAITING", "W", "white"),
-        ]
-
-        for state, short, color in states:
+        for state, short, color in SUMMARY_STATE_LABELS:
             count = summary.get(state, 0)
             if count > 0:
                 parts.append(f"[{color}]{short}:{count}[/{color}]")
@@ -848,22 +863,35 @@ class RocotoApp(App[None]):
 
         with self.batch_update():
             filter_text = filter_input.value.lower()
+            # Compile the highlight pattern once per update rather than per task.
+            highlight_pattern = re.compile(re.escape(filter_text), re.IGNORECASE) if filter_text else None
+            # Reactive attributes go through a descriptor on every access, so read
+            # this once instead of once per task.
+            hide_succeeded = self.hide_succeeded
+            icon_of = STATE_ICONS.get
+            color_of = STATE_COLORS.get
             # To preserve expansion state, we'll track existing nodes
             existing_cycles = {str(node.label): node for node in tree.root.children}
             seen_cycles = set()
+            # The selected cycle is picked up during the tree pass so the data
+            # does not have to be scanned a second time to refresh the table.
+            selected_cycle = self.last_selected_cycle
+            selected_cycle_info = None
 
             for cycle_info in self.all_data:
                 cycle_str = cycle_info["cycle"]
+                if cycle_str == selected_cycle:
+                    selected_cycle_info = cycle_info
 
                 # Pre-filter tasks to see if cycle should be shown
                 visible_tasks = []
                 for task in cycle_info["tasks"]:
-                    if self.hide_succeeded and task["state"] == "SUCCEEDED":
+                    if hide_succeeded and task["state"] == "SUCCEEDED":
                         continue
                     if not filter_text or filter_text in task["task"].lower():
                         visible_tasks.append(task)
 
-                if not visible_tasks and (filter_text or self.hide_succeeded):
+                if not visible_tasks and (filter_text or hide_succeeded):
                     # Cycle should be hidden. If it exists, we skip it
                     # so that it gets removed in the cleanup loop.
                     continue
@@ -887,18 +915,14 @@ class RocotoApp(App[None]):
                         task_name = task["task"]
                         seen_tasks.add(task_name)
                         state = task["state"]
-                        icon = self._get_state_icon(state)
-                        state_color = self._get_state_color(state)
+                        icon = icon_of(state, DEFAULT_STATE_ICON)
+                        state_color = color_of(state, DEFAULT_STATE_COLOR)
 
                         # Highlight matching part of task name
                         display_name = escape(task_name)
-                        if filter_text:
+                        if highlight_pattern is not None:
                             # Use regex for case-insensitive replacement to keep original case
-                            try:
-                                pattern = re.compile(re.escape(filter_text), re.IGNORECASE)
-                                display_name = pattern.sub(lambda m: f"[reverse]{escape(m.group(0))}[/reverse]", task_name)
-                            except re.error:
-                                pass
+                            display_name = highlight_pattern.sub(lambda m: f"[reverse]{escape(m.group(0))}[/reverse]", task_name)
 
                         leaf_label = f"{icon} {display_name} [{state_color}]{state}[/{state_color}]"
 
@@ -925,80 +949,19 @@ class RocotoApp(App[None]):
                     cnode.remove()
 
             # Refresh cycle data and selected task status
-            if self.last_selected_cycle:
-                for cycle_info in self.all_data:
-                    if cycle_info["cycle"] == self.last_selected_cycle:
-                        # Refresh the table for all tasks in this cycle
-                        self._update_task_table(cycle_info["tasks"])
-
-                        # Refresh selected task if one exists
-                        if self.last_selected_task:
-                            for task in cycle_info["tasks"]:
-                                if task["task"] == self.last_selected_task["task"]:
-                                    resolved_task = task.copy()
-                                    if "details" in task:
-                                        resolved_task["details"] = self.parser.resolve_task_details(
-                                            task["details"], self.last_selected_cycle
-                                        )
-                                    self.last_selected_task = resolved_task
-                                    break
-                        break
-
-    def _get_state_icon(self, state: str) -> str:
-        """
-        Get icon for task state.
-
-        Parameters
-        ----------
-        state : str
-            The task state string.
-
-        Returns
-        -------
-        str
-            The icon emoji.
-        """
-        if state == "SUCCEEDED":
-            return "✅"
-        elif state == "RUNNING":
-            return "🏃"
-        elif state == "FAILED":
-            return "❌"
-        elif state == "DEAD":
-            return "💀"
-        elif state == "QUEUED":
-            return "🕒"
-        elif state in ["WAITING", "PENDING"]:
-            return "⌛"
-        return "❓"
-
-    def _get_state_color(self, state: str) -> str:
-        """
-        Get color for task state.
-
-        Parameters
-        ----------
-        state : str
-            The task state string.
-
-        Returns
-        -------
-        str
-            The color name.
-        """
-        if state == "SUCCEEDED":
-            return "green"
-        elif state == "RUNNING":
-            return "yellow"
-        elif state == "FAILED":
-            return "red"
-        elif state == "DEAD":
-            return "red"
-        elif state == "QUEUED":
-            return "blue"
-        elif state in ["WAITING", "PENDING"]:
-            return "white"
-        return "white"
+            if selected_cycle and selected_cycle_info is not None:
+                # Refresh the table for all tasks in this cycle
+                self._update_task_table(selected_cycle_info["tasks"])
+
+                # Refresh selected task if one exists
+                if self.last_selected_task:
+                    for task in selected_cycle_info["tasks"]:
+                        if task["task"] == self.last_selected_task["task"]:
+                            resolved_task = task.copy()
+                            if "details" in task:
+                                resolved_task["details"] = self.parser.resolve_task_details(task["details"], selected_cycle)
+                            self.last_selected_task = resolved_task
+                            break
 
     def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
         """
@@ -1182,11 +1145,13 @@ class RocotoApp(App[None]):
 
         table.clear()
         target_row_idx = -1
+        icon_of = STATE_ICONS.get
+        color_of = STATE_COLORS.get
 
         for i, task in enumerate(sorted_tasks):
             state = task["state"]
-            icon = self._get_state_icon(state)
-            state_color = self._get_state_color(state)
+            icon = icon_of(state, DEFAULT_STATE_ICON)
+            state_color = color_of(state, DEFAULT_STATE_COLOR)
 
             table.add_row(
                 self.last_selected_cycle,
@@ -1242,7 +1207,7 @@ class RocotoApp(App[None]):
         overview.add_column()
 
         overview.add_row("Task:", task["task"], "Cycle:", cycle)
-        state_color = self._get_state_color(task["state"])
+        state_color = STATE_COLORS.get(task["state"], DEFAULT_STATE_COLOR)
         overview.add_row("State:", f"[{state_color}]{task['state']}[/]", "Job ID:", str(task["jobid"] or "-"))
         overview.add_row("Exit:", str(exit_str), "Tries:", str(task["tries"]))
         overview.add_row("Duration:", str(task["duration"] or "-"), "", "")
@@ -1289,14 +1254,14 @@ class RocotoApp(App[None]):
 
         panel.update(Group(*renderables))
 
-    def _format_deps(self, deps: list[dict[str, Any]], indent: int = 0) -> str:
+    def _format_deps(self, deps: Sequence[dict[str, Any]], indent: int = 0) -> str:
         """
         Format dependency list into readable indented text.
 
         Parameters
         ----------
-        deps : list[dict[str, Any]]
-            The dependency list from the parser.
+        deps : Sequence[dict[str, Any]]
+            The dependencies from the parser.
         indent : int
             Current indentation level in spaces.
 
@@ -1312,7 +1277,7 @@ class RocotoApp(App[None]):
             attrib = dep.get("attrib", {})
             text = dep.get("text", "")
 
-            if dep_type in ["and", "or", "not", "nand", "nor", "xor", "some"]:
+            if dep_type in DEPENDENCY_OPERATORS:
                 lines += f"{prefix}- [{dep_type.upper()}]\n"
                 children = dep.get("children", [])
                 lines += self._format_deps(children, indent + 4)
@@ -1729,7 +1694,7 @@ class RocotoApp(App[None]):
         """Close the log search bar and clear highlights."""
         bar = self.query_one("#log_search_bar")
         bar.remove_class("visible")
-        self._search_query = ""
+        self._search_pattern = None
         self._search_matches = []
         self._search_index = -1
         self.query_one("#search_status", Static).update("")
@@ -1752,12 +1717,14 @@ class RocotoApp(App[None]):
         query : str
             The search string (treated as a case-insensitive regex).
         """
-        self._search_query = query
         try:
             pattern = re.compile(query, re.IGNORECASE)
         except re.error:
+            self._search_pattern = None
             self.notify(f"Invalid regex: {query}", severity="error")
             return
+        # Kept for _redraw_log, which runs on every match jump.
+        self._search_pattern = pattern
 
         self._search_matches = [i for i, line in enumerate(self._log_lines) if pattern.search(line)]
 
@@ -1810,11 +1777,8 @@ class RocotoApp(App[None]):
         log_panel = self.query_one("#log_panel", RichLog)
         log_panel.clear()
 
-        try:
-            # Use raw query for regex support, same as _run_log_search
-            pattern = re.compile(self._search_query, re.IGNORECASE) if self._search_query else None
-        except re.error:
-            pattern = None
+        # Compiled once by _run_log_search rather than on every redraw
+        pattern = self._search_pattern
 
         for i, line in enumerate(self._log_lines):
             text = Text(line)
@@ -1840,7 +1804,7 @@ class RocotoApp(App[None]):
         log_panel = self.query_one("#log_panel", RichLog)
         log_panel.clear()
         self._log_lines = []
-        self._search_query = ""
+        self._search_pattern = None
         self._search_matches = []
         self._search_index = -1
         self.query_one("#search_status", Static).update("")
@@ -1873,11 +1837,8 @@ class RocotoApp(App[None]):
         """
         log_panel = self.query_one("#log_panel", RichLog)
         try:
-            if not await asyncio.to_thread(os.path.exists, log_file):
-                log_panel.write(f"Log file not found: {log_file}")
-                return
-
-            size = await asyncio.to_thread(os.path.getsize, log_file)
+            # One stat covers both the existence check and the size.
+            size = (await asyncio.to_thread(os.stat, log_file)).st_size
             async with aiofiles.open(log_file, encoding="utf-8", errors="replace") as f:
                 if size > self.MAX_LOG_READ_SIZE:
                     await f.seek(size - self.MAX_LOG_READ_SIZE)
@@ -1901,6 +1862,8 @@ class RocotoApp(App[None]):
                             log_panel.scroll_end()
                     else:
                         await asyncio.sleep(0.1)
+        except FileNotFoundError:
+            log_panel.write(f"Log file not found: {log_file}")
         except Exception as e:
             if self.is_running:
                 self.notify(f"Error reading log: {e}", severity="error")
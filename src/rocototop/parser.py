@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import io
 import logging
+import operator
 import os
 import re
 import sqlite3
+import sys
 import xml.etree.ElementTree as ET
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any, TypedDict
@@ -48,8 +51,8 @@ class TaskDetails(TypedDict):
         The path to the stdout log.
     stderr : str
         The path to the stderr log.
-    dependencies : list[dict[str, Any]]
-        The list of task dependencies.
+    dependencies : tuple[dict[str, Any], ...]
+        The task dependencies.
     """
 
     name: str
@@ -63,7 +66,7 @@ class TaskDetails(TypedDict):
     stdout: str
     stderr: str
     envars: dict[str, str]
-    dependencies: list[dict[str, Any]]
+    dependencies: tuple[dict[str, Any], ...]
 
 
 class TaskStatus(TypedDict):
@@ -123,11 +126,49 @@ CYCLE_FORMAT = "%Y%m%d%H%M"
 ENTITY_RECURSION_LIMIT = 3
 CYCLE_TIMESTAMP_THRESHOLD = 200000000000
 
+# Task child elements whose content is stored verbatim on the RocotoTask
+# attribute of the same name.
+TASK_TEXT_FIELDS = frozenset({"command", "account", "queue", "walltime", "memory", "join", "stdout", "stderr"})
+
+# Dependency tags that combine child dependencies rather than naming a
+# condition of their own.
+DEPENDENCY_OPERATORS = frozenset({"and", "or", "not", "nand", "nor", "xor", "some"})
+
+# Columns copied from a jobs row into each TaskStatus, and the values used for
+# tasks that have no job record yet.
+JOB_FIELDS = operator.itemgetter("state", "exit_status", "duration", "tries", "jobid")
+JOB_DEFAULTS = ("WAITING", None, None, 0, None)
+
+# Rocoto <cyclestr> flags and their strftime equivalents
+CYCLESTR_FLAGS = {
+    "@Y": "%Y",
+    "@y": "%y",
+    "@m": "%m",
+    "@d": "%d",
+    "@H": "%H",
+    "@I": "%I",
+    "@M": "%M",
+    "@S": "%S",
+    "@p": "%p",
+    "@j": "%j",
+    "@A": "%A",
+    "@a": "%a",
+    "@B": "%B",
+    "@b": "%b",
+}
+
 # Pre-compiled Regex Patterns
 CYCLYSTR_RE = re.compile(r"<cyclestr(?:\s+[^>]*?)?>(.*?)</cyclestr>", re.DOTALL)
 OFFSET_RE = re.compile(r'offset=["\'](.*?)["\']')
 DOCTYPE_SUBSET_RE = re.compile(r"<!DOCTYPE\s+\w+\s*\[.*?\]\s*>", re.DOTALL)
 DOCTYPE_SIMPLE_RE = re.compile(r"<!DOCTYPE[^>]*>")
+# Any XML Name may be declared as an entity, so match broadly and let the
+# entity table decide which references are substituted.
+ENTITY_REF_RE = re.compile(r"&([^\s&;#]+);")
+
+
+class _DTDCompleteError(Exception):
+    """Raised by the expat entity scanner once the root element starts."""
 
 
 class RocotoTask:
@@ -156,10 +197,27 @@ class RocotoTask:
         The path to the stdout log.
     stderr : str
         The path to the stderr log.
-    dependencies : list[dict[str, Any]]
-        The list of task dependencies.
+    dependencies : tuple[dict[str, Any], ...]
+        The task dependencies.
     """
 
+    # One instance exists per expanded task, so avoid a per-instance __dict__.
+    __slots__ = (
+        "name",
+        "cycledefs",
+        "cycledef_groups",
+        "command",
+        "account",
+        "queue",
+        "walltime",
+        "memory",
+        "join",
+        "stdout",
+        "stderr",
+        "envars",
+        "dependencies",
+    )
+
     def __init__(self, name: str, cycledefs: str) -> None:
         """
         Initialize a RocotoTask.
@@ -183,7 +241,7 @@ class RocotoTask:
         self.stdout: str = ""
         self.stderr: str = ""
         self.envars: dict[str, str] = {}
-        self.dependencies: list[dict[str, Any]] = []
+        self.dependencies: tuple[dict[str, Any], ...] = ()
 
     def to_dict(self) -> TaskDetails:
         """
@@ -230,8 +288,14 @@ class RocotoParser:
         Dictionary mapping metatask names to their child task names.
     cycledef_group_cycles : dict[str, set[str]]
         Dictionary mapping cycledef groups to their sets of cycles.
+    cycledef_group_tasks : dict[str, set[str]]
+        Dictionary mapping cycledef groups to the names of tasks that use them.
+    default_cycle_tasks : set[str]
+        Names of tasks without explicit cycledefs, which run in every cycle.
     _last_parsed_mtime : float | None
         The modification time of the XML file when it was last parsed.
+    _task_handlers : dict[str, Callable]
+        Dispatch table mapping task-bearing tags to their handler methods.
     """
 
     def __init__(self, workflow_file: str, database_file: str) -> None:
@@ -252,7 +316,17 @@ class RocotoParser:
         self.tasks_ordered: list[str] = []
         self.metatask_list: dict[str, list[str]] = defaultdict(list)
         self.cycledef_group_cycles: dict[str, set[str]] = defaultdict(set)
+        self.cycledef_group_tasks: dict[str, set[str]] = defaultdict(set)
+        self.default_cycle_tasks: set[str] = set()
         self._last_parsed_mtime: float | None = None
+        # Handlers for elements that can appear inside the workflow, <tasks>
+        # and <metatask> containers, keyed by tag.
+        self._task_handlers: dict[str, Callable[[ET.Element, dict[str, str], list[str]], None]] = {
+            "task": self._add_task,
+            "metatask": self._expand_metatask,
+            "tasks": self._process_tasks_tag,
+        }
+        self._dep_leaf_cache: dict[tuple[str, tuple[tuple[str, str], ...], str], dict[str, Any]] = {}
 
     async def parse_workflow(self) -> None:
         """
@@ -266,14 +340,20 @@ class RocotoParser:
         -------
         None
         """
-        if not await asyncio.to_thread(os.path.exists, self.workflow_file):
+        try:
+            # A single stat both checks that the file exists and provides its
+            # mtime, which matters on network filesystems where each call is slow.
+            mtime = (await asyncio.to_thread(os.stat, self.workflow_file)).st_mtime
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error("Failed to read workflow XML file: %s", e)
             return
 
-        try:
-            mtime = await asyncio.to_thread(os.path.getmtime, self.workflow_file)
-            if self._last_parsed_mtime is not None and mtime <= self._last_parsed_mtime:
-                return
+        if self._last_parsed_mtime is not None and mtime <= self._last_parsed_mtime:
+            return
 
+        try:
             async with aiofiles.open(self.workflow_file, encoding="utf-8") as f:
                 content = await f.read()
             self._last_parsed_mtime = mtime
@@ -286,8 +366,9 @@ class RocotoParser:
         self.entity_values = await asyncio.to_thread(self._get_entity_values, content)
 
         # We need multiple passes if parameter entities define other entities
-        # or if general entities are used within other entities.
-        for _ in range(ENTITY_RECURSION_LIMIT):
+        # or if general entities are used within other entities. Workflows
+        # without any entity declarations skip this entirely.
+        for _ in range(ENTITY_RECURSION_LIMIT if self.entity_values else 0):
             new_content = self._resolve_parameter_entities(content, self.entity_values)
             if new_content == content:
                 break
@@ -313,6 +394,9 @@ class RocotoParser:
         str
             Content with parameter entities resolved.
         """
+        # A single scan rules out the common case of no parameter entity references.
+        if "%" not in content:
+            return content
         for k, v in entities.items():
             # Parameter entities are used as %name;
             if f"%{k};" in content:
@@ -380,14 +464,20 @@ class RocotoParser:
 
             entity_values[entity_name] = resolved
 
+        def stop_at_root(*_args: Any) -> None:
+            raise _DTDCompleteError
+
         parser = xml.parsers.expat.ParserCreate()
         parser.EntityDeclHandler = entity_decl_handler
         # Stop parsing after the DTD — we only need entity declarations.
-        # Use a start-element handler that aborts once the root element begins.
-        parser.StartElementHandler = lambda *_args: None
+        # Use a start-element handler that aborts once the root element begins,
+        # so the workflow body is never tokenized.
+        parser.StartElementHandler = stop_at_root
 
         try:
             parser.Parse(content, True)
+        except _DTDCompleteError:
+            pass
         except xml.parsers.expat.ExpatError:
             # Expat may fail on unresolved entity refs in the body — that's fine,
             # we already captured the declarations from the DTD.
@@ -408,42 +498,116 @@ class RocotoParser:
         -------
         None
         """
-        try:
-            # Substitute entities
-            for _ in range(ENTITY_RECURSION_LIMIT):
-                changed = False
-                for k, v in self.entity_values.items():
-                    if f"&{k};" in content:
-                        content = content.replace(f"&{k};", v)
-                        changed = True
-                if not changed:
-                    break
-
-            # Strip DOCTYPE declarations before passing to ElementTree, which
-            # cannot handle DTD internal subsets or entity references.
-            # First strip DOCTYPEs with internal subsets, then simple ones.
-            content = DOCTYPE_SUBSET_RE.sub("", content)
-            content = DOCTYPE_SIMPLE_RE.sub("", content)
-
-            root = ET.fromstring(content.strip())
-        except ET.ParseError as e:
-            logger.error("Failed to parse workflow XML: %s", e)
-            return
-
+        # Substitute entities. Nested references are resolved within the small
+        # entity table first, so the document itself is scanned only once.
+        if self.entity_values:
+            entity_values = self._expand_entity_values(self.entity_values)
+
+            def substitute(match: re.Match) -> str:
+                name = match.group(1)
+                return entity_values[name] if name in entity_values else match.group(0)
+
+            content = ENTITY_REF_RE.sub(substitute, content)
+
+        # Strip DOCTYPE declarations before passing to ElementTree, which
+        # cannot handle DTD internal subsets or entity references.
+        # First strip DOCTYPEs with internal subsets, then simple ones.
+        content = DOCTYPE_SUBSET_RE.sub("", content)
+        content = DOCTYPE_SIMPLE_RE.sub("", content)
+
+        previous_state = (
+            self.tasks_dict,
+            self.tasks_ordered,
+            self.metatask_list,
+            self.cycledef_group_cycles,
+            self.cycledef_group_tasks,
+            self.default_cycle_tasks,
+        )
         self.tasks_dict = {}
         self.tasks_ordered = []
         self.metatask_list = defaultdict(list)
         self.cycledef_group_cycles = defaultdict(set)
+        self.cycledef_group_tasks = defaultdict(set)
+        self.default_cycle_tasks = set()
+
+        # Stream the document so that only one top-level subtree is held in
+        # memory at a time. Each direct child of the root is processed as soon
+        # as it is complete and then detached from the root.
+        root: ET.Element | None = None
+        depth = 0
+        try:
+            for event, elem in ET.iterparse(io.StringIO(content.strip()), events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if depth != 1:
+                    continue
+
+                if elem.tag == "cycledef":
+                    self._parse_cycledef(elem)
+                else:
+                    handler = self._task_handlers.get(elem.tag)
+                    if handler is not None:
+                        handler(elem, {}, [])
+                root.remove(elem)
+        except ET.ParseError as e:
+            logger.error("Failed to parse workflow XML: %s", e)
+            (
+                self.tasks_dict,
+                self.tasks_ordered,
+                self.metatask_list,
+                self.cycledef_group_cycles,
+                self.cycledef_group_tasks,
+                self.default_cycle_tasks,
+            ) = previous_state
+        finally:
+            # The cache is only needed while tasks are being built; its keys
+            # would otherwise keep every distinct leaf alive after the parse.
+            self._dep_leaf_cache = {}
+
+    @staticmethod
+    def _expand_entity_values(entities: dict[str, str]) -> dict[str, str]:
+        """
+        Resolve references between entity values.
+
+        An entity value may refer to entities declared before or after it.
+        Each value is expanded once and memoized. A reference that would
+        recurse into an entity already being expanded is left as written,
+        as are references to undeclared names such as ``&amp;``.
+
+        Parameters
+        ----------
+        entities : dict[str, str]
+            Entity values as declared in the DTD.
 
-        for child in root:
-            if child.tag == "cycledef":
-                self._parse_cycledef(child)
-            elif child.tag == "task":
-                self._add_task(child, {}, [])
-            elif child.tag == "metatask":
-                self._expand_metatask(child, {}, [])
-            elif child.tag == "tasks":
-                self._process_tasks_tag(child, {}, [])
+        Returns
+        -------
+        dict[str, str]
+            Entity values with all resolvable references substituted.
+        """
+        expanded: dict[str, str] = {}
+        in_progress: set[str] = set()
+
+        def substitute(match: re.Match) -> str:
+            name = match.group(1)
+            if name not in entities or name in in_progress:
+                return match.group(0)
+            return expand(name)
+
+        def expand(name: str) -> str:
+            if name not in expanded:
+                in_progress.add(name)
+                expanded[name] = ENTITY_REF_RE.sub(substitute, entities[name])
+                in_progress.discard(name)
+            return expanded[name]
+
+        for name in entities:
+            expand(name)
+        return expanded
 
     def _parse_cycledef(self, element: ET.Element) -> None:
         """
@@ -462,7 +626,9 @@ class RocotoParser:
         if not element.text:
             return
 
-        text = element.text.strip()
+        # split() already discards surrounding whitespace, so the text is only
+        # stripped when it has to be reported.
+        text = element.text
         parts = text.split()
 
         if len(parts) >= 3:
@@ -474,12 +640,15 @@ class RocotoParser:
                     h, m = time_parts[0], time_parts[1]
                     s = time_parts[2] if len(time_parts) >= 3 else "0"
                     inc = timedelta(hours=int(h), minutes=int(m), seconds=int(s))
-                    curr = start
-                    while curr <= end:
-                        self.cycledef_group_cycles[group].add(curr.strftime(CYCLE_FORMAT))
-                        curr += inc
+                    if inc <= timedelta(0):
+                        logger.warning("Ignoring cycledef '%s' with non-positive increment", text.strip())
+                        return
+                    # The number of cycles is known up front, so generate them
+                    # directly rather than stepping a datetime in a while loop.
+                    num_steps = (end - start) // inc
+                    self.cycledef_group_cycles[group].update((start + i * inc).strftime(CYCLE_FORMAT) for i in range(num_steps + 1))
             except ValueError as e:
-                logger.warning("Failed to parse cycledef text '%s': %s", text, e)
+                logger.warning("Failed to parse cycledef text '%s': %s", text.strip(), e)
 
     def _process_tasks_tag(
         self,
@@ -503,13 +672,35 @@ class RocotoParser:
         -------
         None
         """
+        self._process_children(element, current_vars, parent_metatasks)
+
+    def _process_children(
+        self,
+        element: ET.Element,
+        current_vars: dict[str, str],
+        parent_metatasks: list[str],
+    ) -> None:
+        """
+        Dispatch the task-bearing children of a container element.
+
+        Parameters
+        ----------
+        element : ET.Element
+            The container XML element.
+        current_vars : dict[str, str]
+            Current variable substitutions.
+        parent_metatasks : list[str]
+            List of parent metatask names.
+
+        Returns
+        -------
+        None
+        """
+        handlers = self._task_handlers
         for child in element:
-            if child.tag == "task":
-                self._add_task(child, current_vars, parent_metatasks)
-            elif child.tag == "metatask":
-                self._expand_metatask(child, current_vars, parent_metatasks)
-            elif child.tag == "tasks":
-                self._process_tasks_tag(child, current_vars, parent_metatasks)
+            handler = handlers.get(child.tag)
+            if handler is not None:
+                handler(child, current_vars, parent_metatasks)
 
     def _expand_metatask(
         self,
@@ -542,14 +733,7 @@ class RocotoParser:
                 vars_dict[v_name] = var_elem.text.split()
 
         if not vars_dict:
-            new_parents = parent_metatasks + [m_name]
-            for child in element:
-                if child.tag == "task":
-                    self._add_task(child, current_vars, new_parents)
-                elif child.tag == "metatask":
-                    self._expand_metatask(child, current_vars, new_parents)
-                elif child.tag == "tasks":
-                    self._process_tasks_tag(child, current_vars, new_parents)
+            self._process_children(element, current_vars, parent_metatasks + [m_name])
             return
 
         num_values = len(next(iter(vars_dict.values())))
@@ -563,14 +747,7 @@ class RocotoParser:
             for v_name, v_val in new_vars.items():
                 expanded_m_name = expanded_m_name.replace(f"#{v_name}#", v_val)
 
-            new_parents = parent_metatasks + [expanded_m_name]
-            for child in element:
-                if child.tag == "task":
-                    self._add_task(child, new_vars, new_parents)
-                elif child.tag == "metatask":
-                    self._expand_metatask(child, new_vars, new_parents)
-                elif child.tag == "tasks":
-                    self._process_tasks_tag(child, new_vars, new_parents)
+            self._process_children(element, new_vars, parent_metatasks + [expanded_m_name])
 
     def _add_task(
         self,
@@ -598,13 +775,16 @@ class RocotoParser:
         cycledefs = element.attrib.get("cycledefs", DEFAULT_CYCLE)
 
         def resolve_vars(text: str) -> str:
-            if not text:
+            # Most fields reference no metatask variables; skip the per-variable
+            # replace() passes unless the text can contain a #var# reference.
+            if not text or "#" not in text:
                 return text
             for v_name, v_val in vars_dict.items():
                 text = text.replace(f"#{v_name}#", v_val)
             return text
 
-        name = resolve_vars(name)
+        # Interned so the names read back from the jobs table share these objects.
+        name = sys.intern(resolve_vars(name))
         cycledefs = resolve_vars(cycledefs)
 
         task = RocotoTask(name, cycledefs)
@@ -617,23 +797,10 @@ class RocotoParser:
             return content.strip()
 
         for sub in element:
-            if sub.tag == "command":
-                task.command = resolve_vars(get_content(sub))
-            elif sub.tag == "account":
-                task.account = resolve_vars(get_content(sub))
-            elif sub.tag == "queue":
-                task.queue = resolve_vars(get_content(sub))
-            elif sub.tag == "walltime":
-                task.walltime = resolve_vars(get_content(sub))
-            elif sub.tag == "memory":
-                task.memory = resolve_vars(get_content(sub))
-            elif sub.tag == "join":
-                task.join = resolve_vars(get_content(sub))
-            elif sub.tag == "stdout":
-                task.stdout = resolve_vars(get_content(sub))
-            elif sub.tag == "stderr":
-                task.stderr = resolve_vars(get_content(sub))
-            elif sub.tag == "envar":
+            tag = sub.tag
+            if tag in TASK_TEXT_FIELDS:
+                setattr(task, tag, resolve_vars(get_content(sub)))
+            elif tag == "envar":
                 name_elem = sub.find("name")
                 val_elem = sub.find("value")
                 if name_elem is not None and val_elem is not None:
@@ -641,15 +808,28 @@ class RocotoParser:
                     v_name = resolve_vars(get_content(name_elem))
                     v_val = resolve_vars(get_content(val_elem))
                     task.envars[v_name] = v_val
-            elif sub.tag == "dependency":
+            elif tag == "dependency":
                 task.dependencies = self._parse_deps_with_vars(sub, resolve_vars)
 
+        # Index the task by cycledef group while parsing so that get_status
+        # does not have to rescan every task definition for every cycle.
+        previous = self.tasks_dict.get(name)
+        if previous is not None:
+            self.default_cycle_tasks.discard(name)
+            for group in previous.cycledef_groups:
+                self.cycledef_group_tasks[group].discard(name)
+        if cycledefs == DEFAULT_CYCLE:
+            self.default_cycle_tasks.add(name)
+        else:
+            for group in task.cycledef_groups:
+                self.cycledef_group_tasks[group].add(name)
+
         self.tasks_dict[name] = task
         self.tasks_ordered.append(name)
         for p_name in parent_metatasks:
             self.metatask_list[p_name].append(name)
 
-    def _parse_deps_with_vars(self, element: ET.Element, resolve_vars: Callable[[str], str]) -> list[dict[str, Any]]:
+    def _parse_deps_with_vars(self, element: ET.Element, resolve_vars: Callable[[str], str]) -> tuple[dict[str, Any], ...]:
         """
         Parse task dependencies recursively, resolving variables.
 
@@ -662,14 +842,19 @@ class RocotoParser:
 
         Returns
         -------
-        list[dict[str, Any]]
-            A list of dependency dictionaries.
+        tuple[dict[str, Any], ...]
+            The dependency dictionaries.
         """
         deps = []
         for child in element:
-            attrib = {k: resolve_vars(v) for k, v in child.attrib.items()}
-            dep: dict[str, Any] = {"type": child.tag, "attrib": attrib}
-            if child.tag in ["and", "or", "not", "nand", "nor", "xor", "some"]:
+            # Dependency attributes are read-only once parsed, so the element's
+            # own dict is kept unless a value needs #var# substitution.
+            attrib = child.attrib
+            if any("#" in v for v in attrib.values()):
+                attrib = {k: resolve_vars(v) if "#" in v else v for k, v in attrib.items()}
+            tag = child.tag
+            dep: dict[str, Any] = {"type": tag, "attrib": attrib}
+            if tag in DEPENDENCY_OPERATORS:
                 dep["children"] = self._parse_deps_with_vars(child, resolve_vars)
             else:
                 # Capture full inner content including child tags like <cyclestr>
@@ -677,8 +862,14 @@ class RocotoParser:
                 for sub in child:
                     inner += ET.tostring(sub, encoding="unicode")
                 dep["text"] = resolve_vars(inner.strip())
+                # Identical leaf dependencies (e.g. <taskdep task="prep"/>) recur
+                # across many tasks; share one read-only dict per distinct leaf.
+                key = (tag, tuple(attrib.items()), dep["text"])
+                dep = self._dep_leaf_cache.setdefault(key, dep)
             deps.append(dep)
-        return deps
+        # Dependencies are read-only once parsed, so a tuple avoids a list's
+        # over-allocation.
+        return tuple(deps)
 
     def resolve_cyclestr(self, text: str, cycle: str | datetime) -> str:
         """
@@ -702,36 +893,10 @@ class RocotoParser:
         if isinstance(cycle, datetime):
             dt = cycle
         else:
-            try:
-                dt = datetime.strptime(cycle, CYCLE_FORMAT)
-            except ValueError:
+            parsed = self._parse_cycle_datetime(cycle)
+            if parsed is None:
                 return text
-
-        # Cache for strftime results within this call
-        strftime_cache: dict[tuple[datetime, str], str] = {}
-
-        def get_strftime(current_dt: datetime, fmt: str) -> str:
-            key = (current_dt, fmt)
-            if key not in strftime_cache:
-                strftime_cache[key] = current_dt.strftime(fmt)
-            return strftime_cache[key]
-
-        flags = {
-            "@Y": "%Y",
-            "@y": "%y",
-            "@m": "%m",
-            "@d": "%d",
-            "@H": "%H",
-            "@I": "%I",
-            "@M": "%M",
-            "@S": "%S",
-            "@p": "%p",
-            "@j": "%j",
-            "@A": "%A",
-            "@a": "%a",
-            "@B": "%B",
-            "@b": "%b",
-        }
+            dt = parsed
 
         def replace_cyclestr(match: re.Match) -> str:
             full_tag = match.group(0)
@@ -775,9 +940,11 @@ class RocotoParser:
                     current_dt += delta
 
             res = content
-            for flag, fmt in flags.items():
+            if "@" not in res:
+                return res
+            for flag, fmt in CYCLESTR_FLAGS.items():
                 if flag in res:
-                    res = res.replace(flag, get_strftime(current_dt, fmt))
+                    res = res.replace(flag, self._format_datetime(current_dt, fmt))
             if "@s" in res:
                 res = res.replace("@s", str(int(current_dt.timestamp())))
             return res
@@ -798,11 +965,8 @@ class RocotoParser:
         dict[str, int]
             A dictionary mapping task states to their counts.
         """
-        summary: dict[str, int] = defaultdict(int)
-        for cycle in status_data:
-            for task in cycle["tasks"]:
-                summary[task["state"]] += 1
-        return dict(summary)
+        # Counter tallies in C and is already a dict, so no copy is needed.
+        return Counter(task["state"] for cycle in status_data for task in cycle["tasks"])
 
     async def get_status(self) -> list[CycleStatus]:
         """
@@ -830,32 +994,42 @@ class RocotoParser:
                     "SELECT taskname, cycle, state, exit_status, duration, tries, jobid FROM jobs",
                 ) as cursor:
                     async for row in cursor:
-                        jobs_data[row["cycle"]][row["taskname"]] = dict(row)
+                        job = dict(row)
+                        # Task names repeat in every cycle and a handful of states
+                        # repeat across every job row; interning shares one string per
+                        # value and lets lookups against the XML names hit on identity.
+                        taskname = job["taskname"]
+                        if taskname:
+                            taskname = job["taskname"] = sys.intern(taskname)
+                        if job["state"]:
+                            job["state"] = sys.intern(job["state"])
+                        jobs_data[job["cycle"]][taskname] = job
         except (sqlite3.Error, OSError) as e:
             logger.error("Database error while fetching status: %s", e)
             return []
 
+        xml_task_names = set(self.tasks_ordered)
+        # Task definitions are identical across cycles, so each details dict is
+        # built once and shared by every cycle instead of rebuilt per row.
+        details_by_task = {name: task_def.to_dict() for name, task_def in self.tasks_dict.items()}
+
         result: list[CycleStatus] = []
         for cycle_raw in cycles_raw:
             cycle_str = self._parse_cycle(cycle_raw)
 
             tasks_status = []
 
-            # Determine tasks defined for this cycle in the XML
-            xml_tasks_for_cycle = set()
-            if self.tasks_ordered:
-                for tname in self.tasks_ordered:
-                    task_def = self.tasks_dict[tname]
-                    if task_def.cycledefs == DEFAULT_CYCLE:
-                        xml_tasks_for_cycle.add(tname)
-                    else:
-                        for group in task_def.cycledef_groups:
-                            if cycle_str in self.cycledef_group_cycles.get(group, set()):
-                                xml_tasks_for_cycle.add(tname)
-                                break
+            # Determine tasks defined for this cycle in the XML using the
+            # group index built while parsing.
+            xml_tasks_for_cycle = set(self.default_cycle_tasks)
+            for group, group_tasks in self.cycledef_group_tasks.items():
+                if group_tasks and cycle_str in self.cycledef_group_cycles.get(group, ()):
+                    xml_tasks_for_cycle |= group_tasks
 
-            # Get names of all tasks that have job records in the DB for this cycle
-            db_tasks_for_cycle = set(jobs_data.get(cycle_raw, {}).keys())
+            # Get names of all tasks that have job records in the DB for this cycle.
+            # The keys view supports set operations without copying.
+            cycle_jobs = jobs_data.get(cycle_raw, {})
+            db_tasks_for_cycle = cycle_jobs.keys()
 
             # The set of tasks to show is the union of what's in the XML for this cycle
             # AND anything that actually has a record in the database for this cycle.
@@ -863,29 +1037,29 @@ class RocotoParser:
 
             if not self.tasks_ordered:
                 # Fallback if XML hasn't been parsed: just show what's in the DB
-                ordered_names = sorted(list(db_tasks_for_cycle))
+                ordered_names = sorted(db_tasks_for_cycle)
             else:
                 # Preserve XML order for tasks that exist in XML,
                 # then append any DB-only tasks at the end.
                 ordered_names = [t for t in self.tasks_ordered if t in all_task_names]
-                db_only = sorted(list(db_tasks_for_cycle - set(self.tasks_ordered)))
+                db_only = sorted(db_tasks_for_cycle - xml_task_names)
                 ordered_names.extend(db_only)
 
             for tname in ordered_names:
-                task_def = self.tasks_dict.get(tname)
-                job = jobs_data.get(cycle_raw, {}).get(tname)
+                job = cycle_jobs.get(tname)
+                state, exit_status, duration, tries, jobid = JOB_FIELDS(job) if job else JOB_DEFAULTS
 
                 # Deferred resolution: task details are returned unresolved.
                 # Resolution is performed on-demand when the task is selected in the UI.
-                details = task_def.to_dict() if task_def else {}
+                details = details_by_task.get(tname) or {}
 
                 task_info: TaskStatus = {
                     "task": tname,
-                    "state": job["state"] if job else "WAITING",
-                    "exit": job["exit_status"] if job else None,
-                    "duration": job["duration"] if job else None,
-                    "tries": job["tries"] if job else 0,
-                    "jobid": job["jobid"] if job else None,
+                    "state": state,
+                    "exit": exit_status,
+                    "duration": duration,
+                    "tries": tries,
+                    "jobid": jobid,
                     "details": details,
                 }
                 tasks_status.append(task_info)
@@ -907,8 +1081,15 @@ class RocotoParser:
         Returns
         -------
         dict[str, Any]
-            The details dictionary with resolved strings.
+            The details dictionary with resolved strings. Sequence values,
+            such as ``dependencies`` (a tuple in unresolved details), are
+            returned as lists, so callers should not rely on either type.
         """
+        # Convert the cycle once so nested fields reuse the datetime instead of
+        # round-tripping the cycle string through strptime for each value.
+        if not isinstance(cycle, datetime):
+            cycle = self._parse_cycle_datetime(cycle) or cycle
+
         resolved = {}
         for key, value in details.items():
             if isinstance(value, str):
@@ -918,7 +1099,7 @@ class RocotoParser:
                     resolved[key] = value
             elif isinstance(value, dict):
                 resolved[key] = self.resolve_task_details(value, cycle)
-            elif isinstance(value, list):
+            elif isinstance(value, list | tuple):
                 resolved[key] = [
                     self.resolve_task_details(item, cycle)
                     if isinstance(item, dict)
@@ -955,3 +1136,54 @@ class RocotoParser:
                 except (ValueError, OSError) as e:
                     logger.warning("Failed to parse cycle timestamp %d: %s", cycle_val, e)
         return str(cycle_val) if cycle_val is not None else ""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_datetime(dt: datetime, fmt: str) -> str:
+        """
+        Format a datetime with strftime, memoized across calls.
+
+        Every field of every task in a cycle formats the same few
+        (datetime, flag) pairs, so results are shared between resolutions.
+
+        Parameters
+        ----------
+        dt : datetime
+            The datetime to format.
+        fmt : str
+            The strftime format string.
+
+        Returns
+        -------
+        str
+            The formatted string.
+        """
+        return dt.strftime(fmt)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_cycle_datetime(cycle: str) -> datetime | None:
+        """
+        Parse a YYYYMMDDHHMM cycle string into a datetime.
+
+        Every task in a cycle shares the same cycle string, so results are
+        memoized rather than re-running strptime for each resolution.
+
+        Parameters
+        ----------
+        cycle : str
+            The formatted cycle string.
+
+        Returns
+        -------
+        datetime | None
+            The parsed datetime, or None if the string is not a valid cycle.
+        """
+        # Cycles are all digits; reject anything else without paying for a
+        # strptime failure and the exception it raises.
+        if not cycle.isdigit():
+            return None
+        try:
+            return datetime.strptime(cycle, CYCLE_FORMAT)
+        except ValueError:
+            return None
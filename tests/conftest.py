@@ -36,5 +36,7 @@ def mock_rocoto_files(tmp_path):
 
 @pytest.fixture(autouse=True)
 def clear_parser_cache():
-    """Clear the LRU cache for cycle parsing to ensure test isolation."""
+    """Clear the LRU caches for cycle parsing to ensure test isolation."""
     RocotoParser._parse_cycle.cache_clear()
+    RocotoParser._parse_cycle_datetime.cache_clear()
+    RocotoParser._format_datetime.cache_clear()
@@ -42,7 +42,15 @@ async def test_action_boot_calls_subprocess(mock_app):
 
 
 @pytest.mark.asyncio
-async def test_action_rewind_calls_subprocess(mock_app):
+@pytest.mark.parametrize(
+    "action, command",
+    [
+        ("action_rewind", "rocotorewind"),
+        ("action_complete", "rocotocomplete"),
+        ("action_check", "rocotocheck"),
+    ],
+)
+async def test_action_calls_subprocess(mock_app, action, command):
     async with mock_app.run_test() as pilot:
         with patch("asyncio.create_subprocess_exec") as mock_exec:
             mock_process = AsyncMock()
@@ -50,29 +58,12 @@ async def test_action_rewind_calls_subprocess(mock_app):
             mock_process.returncode = 0
             mock_exec.return_value = mock_process
 
-            mock_app.action_rewind()
+            getattr(mock_app, action)()
             await pilot.pause(0.2)
 
             assert mock_exec.call_count >= 1
-            # Check if ANY of the calls were 'rocotorewind'
-            assert any(call[0][0] == "rocotorewind" for call in mock_exec.call_args_list)
-
-
-@pytest.mark.asyncio
-async def test_action_complete_calls_subprocess(mock_app):
-    async with mock_app.run_test() as pilot:
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = AsyncMock()
-            mock_process.communicate.return_value = (b"", b"")
-            mock_process.returncode = 0
-            mock_exec.return_value = mock_process
-
-            mock_app.action_complete()
-            await pilot.pause(0.2)
-
-            assert mock_exec.call_count >= 1
-            # Check if ANY of the calls were 'rocotocomplete'
-            assert any(call[0][0] == "rocotocomplete" for call in mock_exec.call_args_list)
+            # Check if ANY of the calls were the expected command
+            assert any(call[0][0] == command for call in mock_exec.call_args_list)
 
 
 @pytest.mark.asyncio
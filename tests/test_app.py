@@ -1,38 +1,7 @@
-import sqlite3
-
 import pytest
 from textual.widgets import DataTable, Tree
 
-from rocototop.app import RocotoApp
-
-
-@pytest.fixture
-def mock_rocoto_files(tmp_path):
-    workflow_file = tmp_path / "workflow.xml"
-    db_file = tmp_path / "rocoto.db"
-
-    workflow_content = """<?xml version="1.0"?>
-<workflow name="test">
-  <cycledef group="default">202301010000 202301011200 06:00:00</cycledef>
-  <task name="task1" cycledefs="default"></task>
-</workflow>"""
-    workflow_file.write_text(workflow_content)
-
-    conn = sqlite3.connect(db_file)
-    c = conn.cursor()
-    c.execute("CREATE TABLE cycles (cycle INTEGER)")
-    c.execute("INSERT INTO cycles VALUES (1672531200)")  # 2023-01-01 00:00:00
-    c.execute("""
-        CREATE TABLE jobs (
-            taskname TEXT, cycle INTEGER, state TEXT,
-            exit_status INTEGER, duration INTEGER, tries INTEGER, jobid TEXT
-        )
-    """)
-    c.execute("INSERT INTO jobs VALUES ('task1', 1672531200, 'SUCCEEDED', 0, 100, 1, '12345')")
-    conn.commit()
-    conn.close()
-
-    return str(workflow_file), str(db_file)
+from rocototop.app import DEFAULT_STATE_COLOR, DEFAULT_STATE_ICON, STATE_COLORS, STATE_ICONS, RocotoApp
 
 
 @pytest.mark.asyncio
@@ -125,3 +94,34 @@ async def test_app_status_bar_and_filtering(mock_rocoto_files):
         await pilot.pause(0.1)
 
         assert "Path: Workflow > 202301010000 > task1" in str(status_bar.render())
+
+
+def test_format_deps_nested_operators(mock_rocoto_files):
+    wf, db = mock_rocoto_files
+    app = RocotoApp(workflow_file=wf, database_file=db)
+    deps = (
+        {
+            "type": "and",
+            "attrib": {},
+            "children": (
+                {"type": "taskdep", "attrib": {"task": "prep"}, "text": ""},
+                {"type": "datadep", "attrib": {}, "text": "/data/obs.nc"},
+            ),
+        },
+    )
+    assert app._format_deps(deps) == "- [AND]\n    - taskdep task=prep\n    - datadep /data/obs.nc\n"
+
+
+@pytest.mark.parametrize(
+    "state, icon, color",
+    [
+        ("SUCCEEDED", "✅", "green"),
+        ("RUNNING", "🏃", "yellow"),
+        ("DEAD", "💀", "red"),
+        ("PENDING", "⌛", "white"),
+        ("UNKNOWN", "❓", "white"),
+    ],
+)
+def test_state_icon_and_color(state, icon, color):
+    assert STATE_ICONS.get(state, DEFAULT_STATE_ICON) == icon
+    assert STATE_COLORS.get(state, DEFAULT_STATE_COLOR) == color
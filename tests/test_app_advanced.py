@@ -1,7 +1,7 @@
 import sqlite3
 
 import pytest
-from textual.widgets import DataTable, Input
+from textual.widgets import DataTable, Input, Tree
 
 from rocototop.app import RocotoApp
 
@@ -29,8 +29,11 @@ async def test_app_details_display(mock_advanced_files):
     wf, db = mock_advanced_files
     app = RocotoApp(wf, db)
     async with app.run_test() as pilot:
-        await pilot.pause(0.5)
-        tree = app.query_one("#cycle_tree")
+        for _ in range(50):
+            if not app.workers and app.query_one("#cycle_tree", Tree).root.children:
+                break
+            await pilot.pause(0.1)
+        tree = app.query_one("#cycle_tree", Tree)
         cycle_node = tree.root.children[0]
         cycle_node.expand()
         await pilot.pause(0.1)
@@ -53,8 +56,11 @@ async def test_app_filtering(mock_advanced_files):
     wf, db = mock_advanced_files
     app = RocotoApp(wf, db)
     async with app.run_test() as pilot:
-        await pilot.pause(0.5)
-        tree = app.query_one("#cycle_tree")
+        for _ in range(50):
+            if not app.workers and app.query_one("#cycle_tree", Tree).root.children:
+                break
+            await pilot.pause(0.1)
+        tree = app.query_one("#cycle_tree", Tree)
         cycle_node = tree.root.children[0]
         cycle_node.expand()
         await pilot.pause(0.1)
@@ -102,3 +102,38 @@ async def test_log_viewer_toggle_and_content(mock_rocoto_with_logs):
 
         # The virtual height should have increased
         assert log_panel.virtual_size.height > initial_height
+
+
+@pytest.mark.asyncio
+async def test_log_search_reuses_compiled_pattern(mock_rocoto_with_logs):
+    wf, db, log = mock_rocoto_with_logs
+    app = RocotoApp(workflow_file=wf, database_file=db)
+    async with app.run_test() as pilot:
+        await pilot.pause(0.1)
+        app._log_lines = ["Line 1", "other", "line 3"]
+
+        app._run_log_search("line")
+        pattern = app._search_pattern
+        assert pattern is not None
+        assert app._search_matches == [0, 2]
+
+        app.action_search_next()
+        assert app._search_index == 1
+        assert app._search_pattern is pattern
+
+        app.action_close_log_search()
+        assert app._search_pattern is None
+        assert app._search_matches == []
+
+
+@pytest.mark.asyncio
+async def test_tail_log_missing_file(mock_rocoto_with_logs, tmp_path):
+    wf, db, log = mock_rocoto_with_logs
+    app = RocotoApp(workflow_file=wf, database_file=db)
+    async with app.run_test() as pilot:
+        await pilot.pause(0.1)
+        missing = str(tmp_path / "missing.log")
+        await app.tail_log(missing).wait()
+        await pilot.pause(0.1)
+        log_panel = app.query_one("#log_panel", RichLog)
+        assert any("Log file not found" in line.text for line in log_panel.lines)
@@ -64,3 +64,106 @@ async def test_parallel_vars_expansion(tmp_path):
     assert "task_a_1" in task_names
     assert "task_b_2" in task_names
     assert "task_a_2" not in task_names
+
+
+@pytest.mark.asyncio
+async def test_metatask_dependency_attributes_resolved(tmp_path):
+    workflow_file = tmp_path / "workflow.xml"
+    workflow_file.write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <metatask name="fcst">
+    <var name="mem">01 02</var>
+    <task name="post_#mem#">
+      <dependency>
+        <taskdep task="fcst_#mem#" state="SUCCEEDED"/>
+      </dependency>
+    </task>
+  </metatask>
+</workflow>""")
+
+    parser = RocotoParser(str(workflow_file), "db")
+    await parser.parse_workflow()
+
+    dep = parser.tasks_dict["post_02"].dependencies[0]
+    assert dep["attrib"] == {"task": "fcst_02", "state": "SUCCEEDED"}
+
+
+@pytest.mark.asyncio
+async def test_identical_leaf_dependencies_are_shared(tmp_path):
+    workflow_file = tmp_path / "workflow.xml"
+    workflow_file.write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <metatask name="post">
+    <var name="mem">01 02</var>
+    <task name="post_#mem#">
+      <dependency>
+        <and>
+          <taskdep task="prep"/>
+          <taskdep task="fcst_#mem#"/>
+        </and>
+      </dependency>
+    </task>
+  </metatask>
+</workflow>""")
+
+    parser = RocotoParser(str(workflow_file), "db")
+    await parser.parse_workflow()
+
+    deps_01 = parser.tasks_dict["post_01"].dependencies[0]["children"]
+    deps_02 = parser.tasks_dict["post_02"].dependencies[0]["children"]
+    assert isinstance(deps_01, tuple)
+    assert deps_01[0] is deps_02[0]
+    assert deps_01[0]["attrib"] == {"task": "prep"}
+    assert deps_01[1]["attrib"] == {"task": "fcst_01"}
+    assert deps_02[1]["attrib"] == {"task": "fcst_02"}
+    # The sharing cache is released once the parse is done.
+    assert parser._dep_leaf_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_metatask_vars_resolved_in_task_fields(tmp_path):
+    workflow_file = tmp_path / "workflow.xml"
+    workflow_file.write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <metatask name="fcst">
+    <var name="mem">01 02</var>
+    <task name="fcst_#mem#">
+      <command>run_fcst.sh #mem#</command>
+      <walltime>00:30:00</walltime>
+    </task>
+  </metatask>
+</workflow>""")
+
+    parser = RocotoParser(str(workflow_file), "db")
+    await parser.parse_workflow()
+
+    task = parser.tasks_dict["fcst_02"]
+    assert task.command == "run_fcst.sh 02"
+    assert task.walltime == "00:30:00"
+
+
+@pytest.mark.asyncio
+async def test_dependency_attributes_without_vars_are_not_copied(tmp_path):
+    workflow_file = tmp_path / "workflow.xml"
+    workflow_file.write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <metatask name="post">
+    <var name="mem">01 02</var>
+    <task name="post_#mem#">
+      <dependency>
+        <some threshold="0.5">
+          <taskdep task="fcst_#mem#"/>
+        </some>
+      </dependency>
+    </task>
+  </metatask>
+</workflow>""")
+
+    parser = RocotoParser(str(workflow_file), "db")
+    await parser.parse_workflow()
+
+    some_01 = parser.tasks_dict["post_01"].dependencies[0]
+    some_02 = parser.tasks_dict["post_02"].dependencies[0]
+    assert some_01["attrib"] == {"threshold": "0.5"}
+    assert some_01["attrib"] is some_02["attrib"]
+    assert some_02["children"][0]["attrib"] == {"task": "fcst_02"}
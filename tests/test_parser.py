@@ -1,38 +1,11 @@
 import os
 import sqlite3
+import sys
+from pathlib import Path
 
 import pytest
 
-from rocototop.parser import RocotoParser
-
-
-@pytest.fixture
-def mock_rocoto_files(tmp_path):
-    workflow_file = tmp_path / "workflow.xml"
-    db_file = tmp_path / "rocoto.db"
-
-    workflow_content = """<?xml version="1.0"?>
-<workflow name="test">
-  <cycledef group="default">202301010000 202301011200 06:00:00</cycledef>
-  <task name="task1" cycledefs="default"></task>
-</workflow>"""
-    workflow_file.write_text(workflow_content)
-
-    conn = sqlite3.connect(db_file)
-    c = conn.cursor()
-    c.execute("CREATE TABLE cycles (cycle INTEGER)")
-    c.execute("INSERT INTO cycles VALUES (1672531200)")  # 2023-01-01 00:00:00
-    c.execute("""
-        CREATE TABLE jobs (
-            taskname TEXT, cycle INTEGER, state TEXT,
-            exit_status INTEGER, duration INTEGER, tries INTEGER, jobid TEXT
-        )
-    """)
-    c.execute("INSERT INTO jobs VALUES ('task1', 1672531200, 'SUCCEEDED', 0, 100, 1, '12345')")
-    conn.commit()
-    conn.close()
-
-    return str(workflow_file), str(db_file)
+from rocototop.parser import RocotoParser, RocotoTask
 
 
 @pytest.mark.asyncio
@@ -139,3 +112,126 @@ async def test_parser_get_summary(mock_rocoto_files):
     )
     summary = parser.get_summary(status)
     assert summary == {"SUCCEEDED": 1, "RUNNING": 1}
+
+
+def test_parse_cycle_datetime_memoized():
+    first = RocotoParser._parse_cycle_datetime("202301010600")
+    assert first is not None
+    assert first.hour == 6
+    assert RocotoParser._parse_cycle_datetime("202301010600") is first
+    assert RocotoParser._parse_cycle_datetime("not-a-cycle") is None
+    assert RocotoParser._parse_cycle_datetime.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("cycle", ["", "N/A", "2023-01-01 06:00", "202313010000"])
+def test_parse_cycle_datetime_rejects_invalid(cycle):
+    assert RocotoParser._parse_cycle_datetime(cycle) is None
+
+
+def test_resolve_task_details_parses_cycle_once():
+    parser = RocotoParser("wf", "db")
+    details = {
+        "command": "run.sh <cyclestr>@Y@m@d@H</cyclestr>",
+        "envars": {"PDY": "<cyclestr>@Y@m@d</cyclestr>"},
+        "dependencies": [{"type": "datadep", "attrib": {}, "text": "<cyclestr offset='-06:00:00'>@H</cyclestr>"}],
+    }
+    resolved = parser.resolve_task_details(details, "202301010600")
+    assert resolved["command"] == "run.sh 2023010106"
+    assert resolved["envars"]["PDY"] == "20230101"
+    assert resolved["dependencies"][0]["text"] == "00"
+    assert RocotoParser._parse_cycle_datetime.cache_info().misses == 1
+    assert RocotoParser._parse_cycle_datetime.cache_info().hits == 0
+
+
+@pytest.mark.asyncio
+async def test_get_status_shares_task_details_across_cycles(tmp_path):
+    wf = tmp_path / "workflow.xml"
+    db = tmp_path / "rocoto.db"
+    wf.write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <task name="task1"><command>run.sh</command></task>
+</workflow>""")
+    conn = sqlite3.connect(db)
+    c = conn.cursor()
+    c.execute("CREATE TABLE cycles (cycle INTEGER)")
+    c.executemany("INSERT INTO cycles VALUES (?)", [(1672531200,), (1672552800,)])
+    c.execute("""
+        CREATE TABLE jobs (
+            taskname TEXT, cycle INTEGER, state TEXT,
+            exit_status INTEGER, duration INTEGER, tries INTEGER, jobid TEXT
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+    parser = RocotoParser(str(wf), str(db))
+    await parser.parse_workflow()
+    status = await parser.get_status()
+
+    first, second = (cycle["tasks"][0]["details"] for cycle in status)
+    assert first["command"] == "run.sh"
+    assert first is second
+
+
+def test_rocoto_task_uses_slots():
+    task = RocotoTask("t", "default")
+    assert not hasattr(task, "__dict__")
+    assert task.to_dict()["name"] == "t"
+
+
+@pytest.mark.asyncio
+async def test_get_status_interns_job_states(mock_rocoto_files):
+    wf, db = mock_rocoto_files
+    parser = RocotoParser(wf, db)
+    await parser.parse_workflow()
+    status = await parser.get_status()
+    assert status[0]["tasks"][0]["state"] is sys.intern("SUCCEEDED")
+
+
+@pytest.mark.asyncio
+async def test_get_status_job_fields_and_defaults(mock_rocoto_files):
+    wf, db = mock_rocoto_files
+    Path(wf).write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <cycledef group="default">202301010000 202301011200 06:00:00</cycledef>
+  <task name="task1" cycledefs="default"></task>
+  <task name="task2" cycledefs="default"></task>
+</workflow>""")
+    parser = RocotoParser(wf, db)
+    await parser.parse_workflow()
+    status = await parser.get_status()
+    task1, task2 = status[0]["tasks"]
+    assert (task1["state"], task1["exit"], task1["duration"], task1["tries"], task1["jobid"]) == (
+        "SUCCEEDED",
+        0,
+        100,
+        1,
+        "12345",
+    )
+    assert (task2["state"], task2["exit"], task2["duration"], task2["tries"], task2["jobid"]) == (
+        "WAITING",
+        None,
+        None,
+        0,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_status_interns_task_names(mock_rocoto_files):
+    wf, db = mock_rocoto_files
+    conn = sqlite3.connect(db)
+    conn.execute("INSERT INTO cycles VALUES (1672552800)")
+    conn.execute("INSERT INTO jobs VALUES ('db_only', 1672531200, 'FAILED', 1, 5, 1, '1')")
+    conn.execute("INSERT INTO jobs VALUES ('db_only', 1672552800, 'RUNNING', NULL, NULL, 1, '2')")
+    conn.commit()
+    conn.close()
+
+    parser = RocotoParser(wf, db)
+    await parser.parse_workflow()
+    assert parser.tasks_ordered[0] is sys.intern("task1")
+
+    status = await parser.get_status()
+    first, second = (cycle["tasks"][-1]["task"] for cycle in status)
+    assert first == "db_only"
+    assert first is second
@@ -36,3 +36,75 @@ async def test_entity_substitution_in_xml(tmp_path):
     parser = RocotoParser(str(wf), "db")
     await parser.parse_workflow()
     assert parser.tasks_dict["test"].command == "/path/to/home/bin/run"
+
+
+@pytest.mark.asyncio
+async def test_cycledef_group_task_index(tmp_path):
+    wf = tmp_path / "wf.xml"
+    wf.write_text("""<?xml version="1.0"?>
+<workflow>
+  <cycledef group="gfs">202301010000 202301010600 06:00:00</cycledef>
+  <cycledef group="gdas">202301010000 202301010000 06:00:00</cycledef>
+  <task name="always"></task>
+  <task name="both" cycledefs="gfs, gdas"></task>
+  <task name="moved" cycledefs="gdas"></task>
+  <task name="moved" cycledefs="gfs"></task>
+</workflow>""")
+    parser = RocotoParser(str(wf), "db")
+    await parser.parse_workflow()
+
+    assert parser.default_cycle_tasks == {"always"}
+    assert parser.cycledef_group_tasks["gfs"] == {"both", "moved"}
+    # A redefined task is only indexed under its final cycledefs
+    assert parser.cycledef_group_tasks["gdas"] == {"both"}
+
+
+def test_resolve_cyclestr_without_flags():
+    parser = RocotoParser("wf", "db")
+    assert parser.resolve_cyclestr("<cyclestr>literal</cyclestr>/log", "202301010000") == "literal/log"
+    assert parser.resolve_cyclestr("<cyclestr>@s</cyclestr>", "197001010001") == "60"
+
+
+def test_entity_substitution_keeps_builtin_references():
+    parser = RocotoParser("wf", "db")
+    parser.entity_values = {"ROOT": "/opt", "BIN": "&ROOT;/bin"}
+    parser._load_workflow_xml("""<workflow>
+  <task name="t"><command>&BIN;/run &amp;&amp; echo &lt;done&gt;</command></task>
+</workflow>""")
+    assert parser.tasks_dict["t"].command == "/opt/bin/run && echo <done>"
+
+
+def test_entity_substitution_non_ascii_names():
+    parser = RocotoParser("wf", "db")
+    parser.entity_values = {"Étape": "x", ":racine": "&Étape;/y"}
+    parser._load_workflow_xml("""<workflow>
+  <task name="t"><command>&Étape;/&:racine;</command></task>
+</workflow>""")
+    assert parser.tasks_dict["t"].command == "x/x/y"
+
+
+@pytest.mark.asyncio
+async def test_forward_referenced_entity_chain(tmp_path):
+    workflow_file = tmp_path / "workflow.xml"
+    workflow_file.write_text("""<?xml version="1.0"?>
+<!DOCTYPE workflow [
+  <!ENTITY E0 "&E1;/0">
+  <!ENTITY E1 "&E2;/1">
+  <!ENTITY E2 "&E3;/2">
+  <!ENTITY E3 "&E4;/3">
+  <!ENTITY E4 "/root">
+]>
+<workflow name="test">
+  <task name="t"><command>&E0;/run</command></task>
+</workflow>""")
+
+    parser = RocotoParser(str(workflow_file), "db")
+    await parser.parse_workflow()
+
+    assert parser.tasks_dict["t"].command == "/root/3/2/1/0/run"
+
+
+def test_expand_entity_values_leaves_cycles_unresolved():
+    expanded = RocotoParser._expand_entity_values({"A": "&B;a", "B": "&A;b", "C": "c&amp;"})
+    assert expanded["C"] == "c&amp;"
+    assert "&A;" in expanded["A"] or "&B;" in expanded["A"]
@@ -81,3 +81,31 @@ async def test_parser_xml_parse_error(tmp_path, caplog):
     await parser.parse_workflow()
     assert parser.tasks_ordered == []
     assert "Failed to parse workflow XML" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_parser_xml_parse_error_keeps_previous_state(tmp_path, caplog):
+    wf = tmp_path / "workflow.xml"
+    wf.write_text("<workflow><task name='good'></task></workflow>")
+    parser = RocotoParser(str(wf), "db")
+    await parser.parse_workflow()
+    assert parser.tasks_ordered == ["good"]
+
+    # The first task is complete before the stream hits the error
+    parser._load_workflow_xml("<workflow><task name='partial'></task><task name='bad'>")
+    assert parser.tasks_ordered == ["good"]
+    assert "partial" not in parser.tasks_dict
+    assert "Failed to parse workflow XML" in caplog.text
+
+
+def test_parse_cycledef_increment_handling(caplog):
+    import xml.etree.ElementTree as ET
+
+    parser = RocotoParser("wf", "db")
+    parser._parse_cycledef(ET.fromstring('<cycledef group="g">202301010000 202301011300 06:00:00</cycledef>'))
+    assert parser.cycledef_group_cycles["g"] == {"202301010000", "202301010600", "202301011200"}
+
+    # A zero increment used to loop forever
+    parser._parse_cycledef(ET.fromstring('<cycledef group="z">202301010000 202301011200 00:00:00</cycledef>'))
+    assert not parser.cycledef_group_cycles["z"]
+    assert "non-positive increment" in caplog.text
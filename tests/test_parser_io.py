@@ -1,3 +1,5 @@
+import xml.parsers.expat
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -10,7 +12,7 @@ async def test_parse_workflow_oserror(caplog):
     parser = RocotoParser("wf.xml", "db.db")
     # In async version, we need to patch aiofiles.open or the wrapped thread call
     with patch("asyncio.to_thread") as mock_thread:
-        mock_thread.side_effect = [True, 12345.6, {}, None]  # exists, mtime, get_entities, load_xml
+        mock_thread.side_effect = [SimpleNamespace(st_mtime=12345.6), {}, None]  # stat, get_entities, load_xml
         with patch("aiofiles.open", side_effect=OSError("Mocked OS Error")):
             await parser.parse_workflow()
             assert "Failed to read workflow XML file: Mocked OS Error" in caplog.text
@@ -30,3 +32,30 @@ def test_get_entity_values_logic():
     content = '<!DOCTYPE workflow [ <!ENTITY foo "bar"> ]><workflow></workflow>'
     entities = parser._get_entity_values(content)
     assert entities["foo"] == "bar"
+
+
+def test_get_entity_values_stops_at_root_element():
+    parser = RocotoParser("wf.xml", "db.db")
+    comments = []
+    parser_create = xml.parsers.expat.ParserCreate
+
+    def spy_parser_create(*args, **kwargs):
+        expat_parser = parser_create(*args, **kwargs)
+        expat_parser.CommentHandler = comments.append
+        return expat_parser
+
+    # The body is well formed, so only stopping at the root keeps its comment unseen
+    content = '<!DOCTYPE workflow [ <!-- dtd --> <!ENTITY foo "bar"> ]><workflow><!-- body --><task/></workflow>'
+    with patch("xml.parsers.expat.ParserCreate", side_effect=spy_parser_create):
+        entities = parser._get_entity_values(content)
+    assert entities["foo"] == "bar"
+    assert comments == [" dtd "]
+
+
+@pytest.mark.asyncio
+async def test_parse_workflow_missing_file_is_silent(tmp_path, caplog):
+    parser = RocotoParser(str(tmp_path / "missing.xml"), "db.db")
+    await parser.parse_workflow()
+    assert parser.tasks_ordered == []
+    assert parser._last_parsed_mtime is None
+    assert "Failed to read workflow XML file" not in caplog.text
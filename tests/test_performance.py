@@ -13,9 +13,7 @@ def mock_rocoto_large_log(tmp_path):
     log_file = tmp_path / "large.log"
 
     # Create a log file larger than 100KB
-    with open(log_file, "w") as f:
-        for i in range(10000):
-            f.write(f"Line {i:05} - some extra text to make it bigger\n")
+    log_file.write_text("".join(f"Line {i:05} - some extra text to make it bigger\n" for i in range(10000)))
 
     workflow_content = f"""<?xml version="1.0"?>
 <workflow name="test">
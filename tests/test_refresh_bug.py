@@ -62,3 +62,54 @@ async def test_refresh_updates_status(tmp_path):
 
         # Check if updated
         assert "RUNNING" in str(task_node.label)
+
+
+@pytest.mark.asyncio
+async def test_refresh_updates_selected_task(tmp_path):
+    wf = tmp_path / "workflow.xml"
+    db = tmp_path / "rocoto.db"
+
+    wf.write_text("""<?xml version="1.0"?>
+<workflow name="test">
+  <cycledef group="default">202301010000 202301010100 01:00:00</cycledef>
+  <task name="task1" cycledefs="default"></task>
+</workflow>""")
+
+    conn = sqlite3.connect(db)
+    c = conn.cursor()
+    c.execute("CREATE TABLE cycles (cycle INTEGER)")
+    c.execute("INSERT INTO cycles VALUES (202301010000)")
+    c.execute("INSERT INTO cycles VALUES (202301010100)")
+    c.execute(
+        "CREATE TABLE jobs (taskname TEXT, cycle INTEGER, state TEXT, "
+        "exit_status INTEGER, duration INTEGER, tries INTEGER, jobid TEXT)"
+    )
+    c.execute("INSERT INTO jobs VALUES ('task1', 202301010000, 'SUCCEEDED', 0, 10, 1, '1')")
+    c.execute("INSERT INTO jobs VALUES ('task1', 202301010100, 'QUEUED', NULL, NULL, 0, '2')")
+    conn.commit()
+    conn.close()
+
+    app = RocotoApp(workflow_file=str(wf), database_file=str(db), refresh_interval=60)
+    async with app.run_test() as pilot:
+        for _ in range(50):
+            if not app.workers and app.all_data:
+                break
+            await pilot.pause(0.1)
+
+        app.last_selected_cycle = "202301010100"
+        app.last_selected_task = app.all_data[1]["tasks"][0]
+        assert app.last_selected_task["state"] == "QUEUED"
+
+        conn = sqlite3.connect(db)
+        conn.execute("UPDATE jobs SET state='RUNNING' WHERE cycle=202301010100")
+        conn.commit()
+        conn.close()
+
+        await pilot.press("l")
+        for _ in range(50):
+            if app.last_selected_task["state"] == "RUNNING":
+                break
+            await pilot.pause(0.1)
+
+        assert app.last_selected_task["task"] == "task1"
+        assert app.last_selected_task["state"] == "RUNNING"
@@ -1,43 +1,14 @@
 import asyncio
+import io
 
 # .. note:: warning: "If you modify features, API, or usage, you MUST update the documentation immediately."
-import sqlite3
-
 import pytest
+from rich.console import Console
 from textual.widgets import OptionList, ProgressBar, Static
 
 from rocototop.app import ActionMenu, ConfirmScreen, GlobalSummary, RocotoApp
 
 
-@pytest.fixture
-def mock_rocoto_files(tmp_path):
-    workflow_file = tmp_path / "workflow.xml"
-    db_file = tmp_path / "rocoto.db"
-
-    workflow_content = """<?xml version="1.0"?>
-<workflow name="test">
-  <cycledef group="default">202301010000 202301011200 06:00:00</cycledef>
-  <task name="task1" cycledefs="default"></task>
-</workflow>"""
-    workflow_file.write_text(workflow_content)
-
-    conn = sqlite3.connect(db_file)
-    c = conn.cursor()
-    c.execute("CREATE TABLE cycles (cycle INTEGER)")
-    c.execute("INSERT INTO cycles VALUES (1672531200)")  # 2023-01-01 00:00:00
-    c.execute("""
-        CREATE TABLE jobs (
-            taskname TEXT, cycle INTEGER, state TEXT,
-            exit_status INTEGER, duration INTEGER, tries INTEGER, jobid TEXT
-        )
-    """)
-    c.execute("INSERT INTO jobs VALUES ('task1', 1672531200, 'SUCCEEDED', 0, 100, 1, '12345')")
-    conn.commit()
-    conn.close()
-
-    return str(workflow_file), str(db_file)
-
-
 @pytest.mark.asyncio
 async def test_global_summary_presence(mock_rocoto_files):
     wf, db = mock_rocoto_files
@@ -148,3 +119,33 @@ async def test_split_pane_layout(mock_rocoto_files):
         # Verify they are visible
         assert app.query_one("#details_panel").visible
         assert app.query_one("#log_panel").visible
+
+
+@pytest.mark.asyncio
+async def test_cycle_summary_counts(mock_rocoto_files):
+    wf, db = mock_rocoto_files
+    app = RocotoApp(workflow_file=wf, database_file=db)
+    async with app.run_test() as pilot:
+        for _ in range(50):
+            if app.all_data:
+                break
+            await pilot.pause(0.1)
+
+        app.all_data = [
+            {
+                "cycle": "202301010000",
+                "tasks": [
+                    {"task": "a", "state": "SUCCEEDED"},
+                    {"task": "b", "state": "SUCCEEDED"},
+                    {"task": "c", "state": "FAILED"},
+                    {"task": "d", "state": "SUBMITTING"},
+                ],
+            }
+        ]
+        app._display_cycle_details("202301010000")
+
+        console = Console(file=io.StringIO(), width=80, record=True, color_system=None)
+        console.print(app.query_one("#details_panel", Static).content)
+        # Body rows render as "│ STATE │ COUNT │"
+        rows = [line.strip("│ ").split("│") for line in console.export_text().splitlines() if line.count("│") == 3]
+        assert [[cell.strip() for cell in row] for row in rows] == [["SUCCEEDED", "2"], ["FAILED", "1"], ["SUBMITTING", "1"]]